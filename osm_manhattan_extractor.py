@@ -1,12 +1,20 @@
-import json
-import math
+import functools
+import sys
+from math import sin, cos, asin, sqrt, radians
 from typing import List, Tuple, Optional
+from collections.abc import Mapping
 from dataclasses import dataclass
-from collections import deque
-import heapq
+
+import numpy as np
+import orjson
+from numba import njit, prange
+from scipy.spatial import cKDTree
+
+_EARTH_RADIUS_M = 6371000.0  # Earth's radius in meters
 
 @dataclass
 class IntersectionNode:
+    """User-facing view of one intersection, materialized from the graph columns"""
     id: str
     lat: float
     lng: float
@@ -14,29 +22,390 @@ class IntersectionNode:
     connections: List[str]
     intersection_type: str = "regular"
 
+@njit('f8(f8, f8, f8, f8)', fastmath=True, cache=True)
+def _haversine_kernel(lat1, lng1, lat2, lng2):
+    """Great-circle distance in meters between two points given in degrees"""
+    lat1_rad, lng1_rad = radians(lat1), radians(lng1)
+    lat2_rad, lng2_rad = radians(lat2), radians(lng2)
+    
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+    
+    a = (sin(dlat/2)**2 + 
+         cos(lat1_rad) * cos(lat2_rad) * sin(dlng/2)**2)
+    
+    return _EARTH_RADIUS_M * 2 * asin(sqrt(a))
+
+def _haversine_vector(lat1_rad, lng1_rad, cos_lat1, lat2_rad, lng2_rad, cos_lat2) -> np.ndarray:
+    """Element-wise great-circle distance in meters between arrays in radians"""
+    a = (np.sin((lat2_rad - lat1_rad) * 0.5)**2 +
+         cos_lat1 * cos_lat2 * np.sin((lng2_rad - lng1_rad) * 0.5)**2)
+    
+    return _EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(a))
+
+def _equirect_vector(lat1_rad, lng1_rad, cos_lat1, lat2_rad, lng2_rad, cos_lat2) -> np.ndarray:
+    """Element-wise equirectangular distance in meters between arrays in radians
+    
+    Within street-scale spans this agrees with haversine to well below a
+    millimetre, at the cost of a sqrt instead of sin/asin per pair.
+    """
+    # Mean of the endpoint cosines stands in for cos of the mean latitude
+    dx = (lng2_rad - lng1_rad) * 0.5 * (cos_lat1 + cos_lat2)
+    dy = lat2_rad - lat1_rad
+    
+    return _EARTH_RADIUS_M * np.sqrt(dx * dx + dy * dy)
+
+# Heuristic shrink factor: keeps the equirectangular estimate a strict lower
+# bound despite float32 edge weights and approximation error
+_HEURISTIC_SLACK = 0.999
+
+@njit(cache=True)
+def _equirect_kernel(lat1_rad, lng1_rad, cos_lat1, lat2_rad, lng2_rad, cos_lat2):
+    """Equirectangular distance in meters between two points in radians"""
+    dx = (lng2_rad - lng1_rad) * 0.5 * (cos_lat1 + cos_lat2)
+    dy = lat2_rad - lat1_rad
+    
+    return _EARTH_RADIUS_M * sqrt(dx * dx + dy * dy)
+
+@njit(cache=True)
+def _heap_push(heap_dist, heap_node, size, dist, node):
+    """Push (dist, node) onto an array-backed 4-ary min-heap, return new size"""
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 2
+        if heap_dist[parent] <= dist:
+            break
+        heap_dist[i] = heap_dist[parent]
+        heap_node[i] = heap_node[parent]
+        i = parent
+    heap_dist[i] = dist
+    heap_node[i] = node
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap_dist, heap_node, size):
+    """Pop the minimum entry, return (dist, node, new size)"""
+    top_dist = heap_dist[0]
+    top_node = heap_node[0]
+    size -= 1
+    last_dist = heap_dist[size]
+    last_node = heap_node[size]
+    i = 0
+    while True:
+        first = (i << 2) + 1
+        if first >= size:
+            break
+        # Smallest of up to four children
+        child = first
+        child_dist = heap_dist[first]
+        for c in range(first + 1, min(first + 4, size)):
+            if heap_dist[c] < child_dist:
+                child = c
+                child_dist = heap_dist[c]
+        if last_dist <= child_dist:
+            break
+        heap_dist[i] = child_dist
+        heap_node[i] = heap_node[child]
+        i = child
+    heap_dist[i] = last_dist
+    heap_node[i] = last_node
+    return top_dist, top_node, size
+
+@njit(cache=True)
+def _potential(lats_rad, lngs_rad, cos_lats, node, src, dst):
+    """Average of the to-dst and from-src heuristics, shared by both search directions"""
+    to_dst = _equirect_kernel(lats_rad[node], lngs_rad[node], cos_lats[node],
+                              lats_rad[dst], lngs_rad[dst], cos_lats[dst])
+    from_src = _equirect_kernel(lats_rad[src], lngs_rad[src], cos_lats[src],
+                                lats_rad[node], lngs_rad[node], cos_lats[node])
+    return 0.5 * _HEURISTIC_SLACK * (to_dst - from_src)
+
+@njit(cache=True)
+def _bidirectional_astar(indptr, indices, weights, indptr_rev, indices_rev, weights_rev,
+                         lats_rad, lngs_rad, cos_lats, src, dst):
+    """Bidirectional A* over CSR adjacency, return (node index path, distance)
+    
+    The forward search runs over the CSR arrays and the backward search over
+    their reverse, both keyed on distance plus the same averaged potential.
+    The sum of the two heap minima then bounds any path not yet found, so
+    the search stops once it reaches the best meeting distance. Distances
+    accumulate in float64 whatever the dtype of the edge weights.
+    """
+    n = indptr.shape[0] - 1
+    dist_f = np.full(n, np.inf)
+    dist_b = np.full(n, np.inf)
+    previous = np.full(n, -1, dtype=np.int32)
+    following = np.full(n, -1, dtype=np.int32)
+    # Potential per node, computed the first time either search reaches it
+    potential = np.zeros(n)
+    known = np.zeros(n, dtype=np.bool_)
+    # Every push follows a strict improvement along one edge, so E + 1 slots suffice
+    heap_f_dist = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    heap_f_node = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    heap_b_dist = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    heap_b_node = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    
+    potential[src] = _potential(lats_rad, lngs_rad, cos_lats, src, src, dst)
+    potential[dst] = _potential(lats_rad, lngs_rad, cos_lats, dst, src, dst)
+    known[src] = True
+    known[dst] = True
+    dist_f[src] = 0.0
+    dist_b[dst] = 0.0
+    size_f = _heap_push(heap_f_dist, heap_f_node, 0, potential[src], src)
+    size_b = _heap_push(heap_b_dist, heap_b_node, 0, -potential[dst], dst)
+    
+    best = np.inf
+    meet = -1
+    if src == dst:
+        best = 0.0
+        meet = src
+    
+    forward = True
+    while size_f and size_b:
+        if heap_f_dist[0] + heap_b_dist[0] >= best:
+            break
+        
+        if forward:
+            key, current, size_f = _heap_pop(heap_f_dist, heap_f_node, size_f)
+            
+            # Skip stale entries: a shorter distance was pushed after this one
+            if key <= dist_f[current] + potential[current]:
+                for edge in range(indptr[current], indptr[current + 1]):
+                    neighbor = indices[edge]
+                    new_distance = dist_f[current] + weights[edge]
+                    
+                    if new_distance < dist_f[neighbor]:
+                        if not known[neighbor]:
+                            potential[neighbor] = _potential(
+                                lats_rad, lngs_rad, cos_lats, neighbor, src, dst)
+                            known[neighbor] = True
+                        dist_f[neighbor] = new_distance
+                        previous[neighbor] = current
+                        size_f = _heap_push(heap_f_dist, heap_f_node, size_f,
+                                            new_distance + potential[neighbor], neighbor)
+                        
+                        if new_distance + dist_b[neighbor] < best:
+                            best = new_distance + dist_b[neighbor]
+                            meet = neighbor
+        else:
+            key, current, size_b = _heap_pop(heap_b_dist, heap_b_node, size_b)
+            
+            if key <= dist_b[current] - potential[current]:
+                for edge in range(indptr_rev[current], indptr_rev[current + 1]):
+                    neighbor = indices_rev[edge]
+                    new_distance = dist_b[current] + weights_rev[edge]
+                    
+                    if new_distance < dist_b[neighbor]:
+                        if not known[neighbor]:
+                            potential[neighbor] = _potential(
+                                lats_rad, lngs_rad, cos_lats, neighbor, src, dst)
+                            known[neighbor] = True
+                        dist_b[neighbor] = new_distance
+                        following[neighbor] = current
+                        size_b = _heap_push(heap_b_dist, heap_b_node, size_b,
+                                            new_distance - potential[neighbor], neighbor)
+                        
+                        if new_distance + dist_f[neighbor] < best:
+                            best = new_distance + dist_f[neighbor]
+                            meet = neighbor
+        
+        forward = not forward
+    
+    if meet < 0:
+        return np.empty(0, dtype=np.int32), np.inf
+    
+    # Reconstruct path: src -> meet from the forward tree, meet -> dst from the backward one
+    head = 1
+    node = meet
+    while node != src:
+        node = previous[node]
+        head += 1
+    
+    length = head
+    node = meet
+    while node != dst:
+        node = following[node]
+        length += 1
+    
+    path = np.empty(length, dtype=np.int32)
+    node = meet
+    for i in range(head - 1, -1, -1):
+        path[i] = node
+        node = previous[node]
+    node = meet
+    for i in range(head, length):
+        node = following[node]
+        path[i] = node
+    
+    return path, best
+
+@njit(cache=True)
+def _dijkstra_one(indptr, indices, weights, src):
+    """Single-source Dijkstra over CSR adjacency, return distances to every node"""
+    n = indptr.shape[0] - 1
+    distances = np.full(n, np.inf)
+    # Every push follows a strict improvement along one edge, so E + 1 slots suffice
+    heap_dist = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    heap_node = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    
+    distances[src] = 0.0
+    size = _heap_push(heap_dist, heap_node, 0, 0.0, src)
+    
+    while size:
+        current_distance, current, size = _heap_pop(heap_dist, heap_node, size)
+        
+        # Stale entry: a shorter distance was pushed after this one
+        if current_distance > distances[current]:
+            continue
+        
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            new_distance = current_distance + weights[edge]
+            
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                size = _heap_push(heap_dist, heap_node, size, new_distance, neighbor)
+    
+    return distances
+
+@njit(parallel=True, cache=True)
+def _multi_dijkstra(indptr, indices, weights, sources):
+    """Run _dijkstra_one for each source in parallel, return an (S, N) distance matrix"""
+    out = np.empty((sources.shape[0], indptr.shape[0] - 1))
+    for i in prange(sources.shape[0]):
+        # Each iteration allocates its own heap and distance arrays
+        out[i] = _dijkstra_one(indptr, indices, weights, sources[i])
+    return out
+
+def _decode_intersections(nodes: dict) -> tuple:
+    """Decode the 'intersections' object into per-node columns and CSR arrays
+    
+    Walks the records once against the fixed schema (lat, lng, street_names,
+    connections, optional intersection_type), appending to plain lists
+    through pre-bound methods and converting to NumPy only at the end.
+    """
+    idx_to_id = list(nodes)
+    id_to_idx = {int_id: i for i, int_id in enumerate(idx_to_id)}
+    lookup = id_to_idx.get
+    intern = sys.intern
+    
+    lats = []
+    lngs = []
+    street_names = []
+    type_codes = []
+    type_table = {}
+    indptr = [0]
+    indices = []
+    append_lat = lats.append
+    append_lng = lngs.append
+    append_streets = street_names.append
+    append_type = type_codes.append
+    append_indptr = indptr.append
+    extend_indices = indices.extend
+    type_code = type_table.setdefault
+    
+    for int_data in nodes.values():
+        append_lat(int_data['lat'])
+        append_lng(int_data['lng'])
+        # Intern so every block of e.g. Broadway shares one string object
+        append_streets([intern(name) for name in int_data['street_names']])
+        append_type(type_code(int_data.get('intersection_type', 'regular'), len(type_table)))
+        # Resolve neighbours straight into CSR, dropping ids outside the file
+        extend_indices([j for j in map(lookup, int_data['connections']) if j is not None])
+        append_indptr(len(indices))
+    
+    return (
+        idx_to_id,
+        id_to_idx,
+        np.array(lats, dtype=np.float64),
+        np.array(lngs, dtype=np.float64),
+        street_names,
+        np.array(type_codes, dtype=np.int8 if len(type_table) <= 128 else np.int32),
+        list(type_table),
+        np.array(indptr, dtype=np.int64),
+        np.array(indices, dtype=np.int32),
+    )
+
+class _IntersectionView(Mapping):
+    """Read-only id -> IntersectionNode mapping built on demand from graph columns"""
+    
+    def __init__(self, graph: "ManhattanIntersectionGraph"):
+        self._graph = graph
+    
+    def __getitem__(self, intersection_id: str) -> IntersectionNode:
+        return self._graph._node(self._graph._id_to_idx[intersection_id])
+    
+    def __contains__(self, intersection_id) -> bool:
+        return intersection_id in self._graph._id_to_idx
+    
+    def __iter__(self):
+        return iter(self._graph._idx_to_id)
+    
+    def __len__(self) -> int:
+        return len(self._graph._idx_to_id)
+
 class ManhattanIntersectionGraph:
     """Graph for pathfinding and analysis of Manhattan intersections"""
     
-    def __init__(self, json_file: str):
-        self.intersections = {}
+    def __init__(self, json_file: str, exact_distances: bool = False):
+        # Use haversine rather than the equirectangular approximation for edge weights
+        self.exact_distances = exact_distances
+        self.intersections = _IntersectionView(self)
+        # Node id <-> dense index maps, rebuilt by load_from_json
+        self._idx_to_id = []
+        self._id_to_idx = {}
+        # Per-node columns indexed by dense index, rebuilt by load_from_json
+        self._lats = np.empty(0, dtype=np.float64)
+        self._lngs = np.empty(0, dtype=np.float64)
+        self._street_names = []
+        self._type_codes = np.empty(0, dtype=np.int8)
+        self._type_names = []
+        # Column caches for vectorized queries, rebuilt by load_from_json
+        self._lats_rad = np.empty(0, dtype=np.float64)
+        self._lngs_rad = np.empty(0, dtype=np.float64)
+        self._cos_lats = np.empty(0, dtype=np.float64)
+        self._tree = None
+        # CSR adjacency over node indices, rebuilt by load_from_json
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._weights = np.empty(0, dtype=np.float32)
+        # Reverse CSR for the backward search, rebuilt by _build_reverse_csr
+        self._indptr_rev = np.zeros(1, dtype=np.int64)
+        self._indices_rev = np.empty(0, dtype=np.int32)
+        self._weights_rev = np.empty(0, dtype=np.float32)
+        # Lowercased street name -> indices of nodes on it, rebuilt by _build_street_index
+        self._street_index = {}
+        # Per-instance memo of (src, dst) index pairs; cleared on every load
+        self._cached_shortest_path = functools.lru_cache(maxsize=4096)(self._shortest_path_idx)
         self.load_from_json(json_file)
     
     def load_from_json(self, json_file: str):
         """Load intersection data from JSON file"""
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            with open(json_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
-            for int_id, int_data in data['intersections'].items():
-                node = IntersectionNode(
-                    id=int_data['id'],
-                    lat=int_data['lat'],
-                    lng=int_data['lng'],
-                    street_names=int_data['street_names'],
-                    connections=int_data['connections'],
-                    intersection_type=int_data.get('intersection_type', 'regular')
-                )
-                self.intersections[int_id] = node
+            (idx_to_id, id_to_idx, lats, lngs, street_names,
+             type_codes, type_names, indptr, indices) = _decode_intersections(data['intersections'])
+            
+            self._idx_to_id = idx_to_id
+            self._id_to_idx = id_to_idx
+            self._lats = lats
+            self._lngs = lngs
+            self._street_names = street_names
+            self._type_codes = type_codes
+            self._type_names = type_names
+            self._indptr = indptr
+            self._indices = indices
+            self._lats_rad = np.radians(lats)
+            self._lngs_rad = np.radians(lngs)
+            self._cos_lats = np.cos(self._lats_rad)
+            self._tree = (cKDTree(self._unit_vectors(self._lats_rad, self._lngs_rad))
+                          if self._idx_to_id else None)
+            self._build_edge_weights()
+            self._build_reverse_csr()
+            self._build_street_index()
+            self._cached_shortest_path.cache_clear()
             
             print(f"Loaded {len(self.intersections)} intersections")
             
@@ -45,139 +414,177 @@ class ManhattanIntersectionGraph:
     
     def haversine_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Calculate distance between two points in meters"""
-        R = 6371000  # Earth's radius in meters
-        
-        lat1_rad, lng1_rad = math.radians(lat1), math.radians(lng1)
-        lat2_rad, lng2_rad = math.radians(lat2), math.radians(lng2)
-        
-        dlat = lat2_rad - lat1_rad
-        dlng = lng2_rad - lng1_rad
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
+        # Coerce at the boundary so Decimal/int inputs match the compiled signature
+        return _haversine_kernel(float(lat1), float(lng1), float(lat2), float(lng2))
+    
+    def _haversine_idx(self, u: int, v: int) -> float:
+        """Distance in meters between two nodes using their cached trig"""
+        lats_rad = self._lats_rad
+        lngs_rad = self._lngs_rad
+        cos_lats = self._cos_lats
+        a = (sin((lats_rad[v] - lats_rad[u]) * 0.5)**2 +
+             cos_lats[u] * cos_lats[v] *
+             sin((lngs_rad[v] - lngs_rad[u]) * 0.5)**2)
+        return float(_EARTH_RADIUS_M * 2 * asin(sqrt(a)))
+    
+    def _node(self, idx: int) -> IntersectionNode:
+        """Materialize the IntersectionNode for a dense node index"""
+        idx_to_id = self._idx_to_id
+        return IntersectionNode(
+            id=idx_to_id[idx],
+            lat=float(self._lats[idx]),
+            lng=float(self._lngs[idx]),
+            street_names=self._street_names[idx],
+            connections=[idx_to_id[j] for j in self._neighbor_idxs(idx).tolist()],
+            intersection_type=self._type_names[self._type_codes[idx]]
+        )
+    
+    def _neighbor_idxs(self, idx: int) -> np.ndarray:
+        """Neighbour indices of a node as a slice view into the CSR arrays"""
+        return self._indices[self._indptr[idx]:self._indptr[idx + 1]]
+    
+    def _build_edge_weights(self):
+        """Precompute the distance of every CSR edge"""
+        # Every edge distance in one vectorized pass, aligned with _indices
+        sources = self._edge_sources()
+        distance = _haversine_vector if self.exact_distances else _equirect_vector
+        # Computed in float64 but stored as float32: street-length edges keep
+        # sub-millimetre precision and the arrays A* streams are half the size
+        self._weights = distance(
+            self._lats_rad[sources], self._lngs_rad[sources], self._cos_lats[sources],
+            self._lats_rad[self._indices], self._lngs_rad[self._indices],
+            self._cos_lats[self._indices]
+        ).astype(np.float32)
+    
+    def _build_reverse_csr(self):
+        """Transpose the CSR arrays so each node lists its incoming edges"""
+        # Stable sort by target keeps each node's incoming edges in source order
+        order = np.argsort(self._indices, kind='stable')
+        in_degree = np.bincount(self._indices, minlength=len(self._indptr) - 1)
         
-        return R * c
+        self._indptr_rev = np.zeros(len(self._indptr), dtype=np.int64)
+        np.cumsum(in_degree, out=self._indptr_rev[1:])
+        self._indices_rev = self._edge_sources()[order].astype(np.int32)
+        self._weights_rev = self._weights[order]
+    
+    def _build_street_index(self):
+        """Map each lowercased street name to the nodes carrying it"""
+        street_index = {}
+        # Lowercase each distinct (interned) name once, not once per node
+        lowered = {}
+        for i, names in enumerate(self._street_names):
+            for name in names:
+                key = lowered.get(name)
+                if key is None:
+                    key = lowered[name] = name.lower()
+                bucket = street_index.setdefault(key, [])
+                # A node may list the same street twice
+                if not bucket or bucket[-1] != i:
+                    bucket.append(i)
+        self._street_index = street_index
+    
+    def _edge_sources(self) -> np.ndarray:
+        """Source node index of every CSR edge, aligned with _indices"""
+        return np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+    
+    @staticmethod
+    def _unit_vectors(lat_rad, lng_rad) -> np.ndarray:
+        """Convert lat/lng in radians to 3-D points on the unit sphere"""
+        cos_lat = np.cos(lat_rad)
+        return np.stack((cos_lat * np.cos(lng_rad),
+                         cos_lat * np.sin(lng_rad),
+                         np.sin(lat_rad)), axis=-1)
     
     def find_nearest_intersection(self, lat: float, lng: float) -> Optional[IntersectionNode]:
         """Find the closest intersection to given coordinates"""
-        if not self.intersections:
+        if self._tree is None:
             return None
         
-        min_distance = float('inf')
-        nearest = None
-        
-        for intersection in self.intersections.values():
-            distance = self.haversine_distance(lat, lng, intersection.lat, intersection.lng)
-            if distance < min_distance:
-                min_distance = distance
-                nearest = intersection
+        # Chord length on the unit sphere is monotonic in great-circle
+        # distance, so the Euclidean nearest neighbour is the closest node
+        query = self._unit_vectors(np.radians(lat), np.radians(lng))
+        _, index = self._tree.query(query, k=1)
         
-        return nearest
+        return self._node(int(index))
     
     def get_neighbors(self, intersection_id: str) -> List[IntersectionNode]:
         """Get all neighboring intersections"""
-        if intersection_id not in self.intersections:
+        if intersection_id not in self._id_to_idx:
             return []
         
-        neighbors = []
-        for neighbor_id in self.intersections[intersection_id].connections:
-            if neighbor_id in self.intersections:
-                neighbors.append(self.intersections[neighbor_id])
-        
-        return neighbors
+        return [self._node(j) for j in self._neighbor_idxs(self._id_to_idx[intersection_id]).tolist()]
     
     def shortest_path(self, start_id: str, end_id: str) -> Tuple[List[str], float]:
-        """Find shortest path between two intersections using Dijkstra's algorithm"""
-        if start_id not in self.intersections or end_id not in self.intersections:
+        """Find shortest path between two intersections using bidirectional A* search"""
+        if start_id not in self._id_to_idx or end_id not in self._id_to_idx:
             return [], float('inf')
         
-        # Dijkstra's algorithm
-        distances = {node_id: float('inf') for node_id in self.intersections}
-        previous = {}
-        distances[start_id] = 0
-        unvisited = [(0, start_id)]
-        visited = set()
+        path, distance = self._cached_shortest_path(
+            self._id_to_idx[start_id], self._id_to_idx[end_id]
+        )
         
-        while unvisited:
-            current_distance, current_id = heapq.heappop(unvisited)
-            
-            if current_id in visited:
-                continue
-            
-            visited.add(current_id)
-            
-            if current_id == end_id:
-                break
-            
-            current_node = self.intersections[current_id]
-            
-            for neighbor_id in current_node.connections:
-                if neighbor_id in visited or neighbor_id not in self.intersections:
-                    continue
-                
-                neighbor_node = self.intersections[neighbor_id]
-                distance = self.haversine_distance(
-                    current_node.lat, current_node.lng,
-                    neighbor_node.lat, neighbor_node.lng
-                )
-                
-                new_distance = current_distance + distance
-                
-                if new_distance < distances[neighbor_id]:
-                    distances[neighbor_id] = new_distance
-                    previous[neighbor_id] = current_id
-                    heapq.heappush(unvisited, (new_distance, neighbor_id))
+        idx_to_id = self._idx_to_id
+        return [idx_to_id[i] for i in path], distance
+    
+    def _shortest_path_idx(self, src: int, dst: int) -> Tuple[Tuple[int, ...], float]:
+        """Shortest path between node indices as a hashable (path, distance) pair"""
+        path, distance = _bidirectional_astar(
+            self._indptr, self._indices, self._weights,
+            self._indptr_rev, self._indices_rev, self._weights_rev,
+            self._lats_rad, self._lngs_rad, self._cos_lats,
+            src, dst
+        )
         
-        # Reconstruct path
-        if end_id not in previous and start_id != end_id:
-            return [], float('inf')
+        if not len(path):
+            return (), float('inf')
         
-        path = []
-        current = end_id
-        while current is not None:
-            path.append(current)
-            current = previous.get(current)
+        return tuple(path.tolist()), distance
+    
+    def shortest_paths_from(self, source_ids: List[str]) -> np.ndarray:
+        """Distances in meters from each source to every intersection
         
-        path.reverse()
-        return path, distances[end_id]
+        Returns an (len(source_ids), N) float64 array whose columns follow the
+        iteration order of self.intersections; unreachable nodes are inf.
+        Sources are searched in parallel across cores.
+        """
+        sources = np.array([self._id_to_idx[int_id] for int_id in source_ids], dtype=np.int64)
+        return _multi_dijkstra(self._indptr, self._indices, self._weights, sources)
     
     def find_intersections_by_street(self, street_name: str) -> List[IntersectionNode]:
         """Find all intersections on a given street"""
-        results = []
         street_name_lower = street_name.lower()
         
-        for intersection in self.intersections.values():
-            for name in intersection.street_names:
-                if street_name_lower in name.lower():
-                    results.append(intersection)
-                    break
+        # Substring match against the unique street names rather than every
+        # node, then union the matching buckets back into load order
+        matches = set()
+        for name, bucket in self._street_index.items():
+            if street_name_lower in name:
+                matches.update(bucket)
         
-        return results
+        return [self._node(i) for i in sorted(matches)]
     
     def get_intersection_info(self, intersection_id: str) -> dict:
         """Get detailed information about an intersection"""
-        if intersection_id not in self.intersections:
+        if intersection_id not in self._id_to_idx:
             return {}
         
-        intersection = self.intersections[intersection_id]
-        neighbors = self.get_neighbors(intersection_id)
+        idx = self._id_to_idx[intersection_id]
+        intersection = self._node(idx)
+        neighbor_idxs = self._neighbor_idxs(idx).tolist()
         
         return {
             "id": intersection.id,
             "coordinates": (intersection.lat, intersection.lng),
             "streets": intersection.street_names,
             "type": intersection.intersection_type,
-            "neighbor_count": len(neighbors),
+            "neighbor_count": len(neighbor_idxs),
             "neighbors": [
                 {
-                    "id": n.id,
-                    "streets": n.street_names,
-                    "distance_meters": self.haversine_distance(
-                        intersection.lat, intersection.lng, n.lat, n.lng
-                    )
+                    "id": self._idx_to_id[j],
+                    "streets": self._street_names[j],
+                    "distance_meters": self._haversine_idx(idx, j)
                 }
-                for n in neighbors
+                for j in neighbor_idxs
             ]
         }
     
@@ -194,50 +601,49 @@ class ManhattanIntersectionGraph:
                 "total_nodes": len(self.intersections),
                 "coordinate_system": "WGS84",
                 "bounds": {
-                    "north": max(n.lat for n in self.intersections.values()),
-                    "south": min(n.lat for n in self.intersections.values()),
-                    "east": max(n.lng for n in self.intersections.values()),
-                    "west": min(n.lng for n in self.intersections.values())
+                    "north": float(self._lats.max()),
+                    "south": float(self._lats.min()),
+                    "east": float(self._lngs.max()),
+                    "west": float(self._lngs.min())
                 }
             }
         }
         
-        # Export nodes
-        for intersection in self.intersections.values():
-            web_data["nodes"].append({
-                "id": intersection.id,
-                "lat": intersection.lat,
-                "lng": intersection.lng,
-                "streets": intersection.street_names,
-                "type": intersection.intersection_type
-            })
+        # Export nodes straight from the columns
+        web_data["nodes"] = [
+            {"id": int_id, "lat": lat, "lng": lng, "streets": streets, "type": int_type}
+            for int_id, lat, lng, streets, int_type in zip(
+                self._idx_to_id, self._lats.tolist(), self._lngs.tolist(),
+                self._street_names, [self._type_names[c] for c in self._type_codes.tolist()]
+            )
+        ]
         
-        # Export edges with distances
-        edge_set = set()
-        for intersection in self.intersections.values():
-            for neighbor_id in intersection.connections:
-                if neighbor_id in self.intersections:
-                    # Create sorted edge to avoid duplicates
-                    edge = tuple(sorted([intersection.id, neighbor_id]))
-                    if edge not in edge_set:
-                        edge_set.add(edge)
-                        
-                        neighbor = self.intersections[neighbor_id]
-                        distance = self.haversine_distance(
-                            intersection.lat, intersection.lng,
-                            neighbor.lat, neighbor.lng
-                        )
-                        
-                        web_data["edges"].append({
-                            "from": edge[0],
-                            "to": edge[1],
-                            "distance": round(distance, 1)
-                        })
+        # Export edges, deduplicated as id-sorted pairs in bulk over the CSR arrays
+        ids = np.array(self._idx_to_id)
+        sources = self._edge_sources()
+        targets = self._indices
+        rank = np.empty(len(ids), dtype=np.int64)
+        rank[np.argsort(ids)] = np.arange(len(ids))
+        swap = rank[targets] < rank[sources]
+        lo = np.where(swap, targets, sources)
+        hi = np.where(swap, sources, targets)
+        # First occurrence of each pair, kept in CSR order
+        _, first = np.unique(lo * len(ids) + hi, return_index=True)
+        first.sort()
+        
+        web_data["edges"] = [
+            {"from": from_id, "to": to_id, "distance": round(distance, 1)}
+            for from_id, to_id, distance in zip(
+                ids[lo[first]].tolist(),
+                ids[hi[first]].tolist(),
+                self._weights[first].tolist()
+            )
+        ]
         
         web_data["metadata"]["total_edges"] = len(web_data["edges"])
         
-        with open(output_file, 'w') as f:
-            json.dump(web_data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(web_data, option=orjson.OPT_INDENT_2))
         
         print(f"Web-optimized data exported to {output_file}")
         return output_file